@@ -1,20 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
 import os
+import threading
 import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from engine import run_analysis
-from pdf_report import build_pdf
+from pdf_report import accelerated as pdf_accelerated, build_pdf, warm_up as warm_up_pdf
 from database import Calculation, Lead, create_tables, get_db
+import orjson
 import resend
 
 # ---------------------------------------------------------------------------
@@ -26,6 +33,20 @@ RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")
 INSTALLER_EMAIL = os.getenv("INSTALLER_EMAIL", "")
 CLEARHEAT_FROM_EMAIL = os.getenv("CLEARHEAT_FROM_EMAIL", "noreply@clearheat.ie")
 
+
+def _pdf_workers_from_env() -> int:
+    raw = os.getenv("CLEARHEAT_PDF_WORKERS", "0")
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        print(f"Warning: CLEARHEAT_PDF_WORKERS={raw!r} is not an integer; rendering PDFs in threads")
+        return 0
+
+
+# build_pdf is pure-Python CPU work. Opt in to worker processes to keep it off the
+# GIL under concurrent load; the default 0 renders in a thread instead.
+PDF_WORKERS = _pdf_workers_from_env()
+
 if RESEND_API_KEY:
     resend.api_key = RESEND_API_KEY
 
@@ -33,7 +54,14 @@ if RESEND_API_KEY:
 # App
 # ---------------------------------------------------------------------------
 
-app = FastAPI(title="Heat Pump Payback API", version="0.2.0")
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson (C encoder; handles NumPy values natively)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+app = FastAPI(title="Heat Pump Payback API", version="0.2.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -48,10 +76,85 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reports are several KB of repetitive JSON keys; small bodies aren't worth compressing
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 @app.on_event("startup")
 def on_startup():
     create_tables()
+    warm_up_pdf()
+    if not pdf_accelerated():
+        print("Warning: ReportLab C accelerator (rl_accel) not loaded; PDFs render on the pure-Python path")
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+    if _PDF_POOL is not None:
+        _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+
+
+# ---------------------------------------------------------------------------
+# PDF rendering
+# ---------------------------------------------------------------------------
+
+_PDF_POOL: Optional[ProcessPoolExecutor] = None
+_PDF_POOL_LOCK = threading.Lock()
+
+
+def _pdf_pool() -> Optional[ProcessPoolExecutor]:
+    """The shared worker pool, started on first use; None when PDF_WORKERS is 0."""
+    global _PDF_POOL
+    if PDF_WORKERS <= 0:
+        return None
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is None:
+            # forkserver, not fork: the server process already has threads (event
+            # loop, threadpool, DB connections) that a forked child would inherit
+            _PDF_POOL = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=warm_up_pdf,
+            )
+        return _PDF_POOL
+
+
+def _discard_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool (a fresh one starts on next use) and reap its threads/workers."""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is pool:
+            _PDF_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _render_pdf(report: dict[str, Any]) -> bytes:
+    """build_pdf off the event loop: in the worker pool, or a thread if disabled/broken."""
+    pool = _pdf_pool()
+    if pool is not None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, build_pdf, report)
+        except BrokenProcessPool:
+            # A worker died; render this one in a thread instead
+            _discard_pdf_pool(pool)
+        except RuntimeError:
+            # Another request discarded this pool after we took it
+            # ("cannot schedule new futures after shutdown")
+            pass
+    return await asyncio.to_thread(build_pdf, report)
+
+
+def _render_pdf_blocking(report: dict[str, Any]) -> bytes:
+    """_render_pdf for sync endpoints, which already run on a threadpool worker."""
+    pool = _pdf_pool()
+    if pool is not None:
+        try:
+            return pool.submit(build_pdf, report).result()
+        except BrokenProcessPool:
+            _discard_pdf_pool(pool)
+        except RuntimeError:
+            pass  # pool already shut down by another request; see _render_pdf
+    return build_pdf(report)
 
 
 # ---------------------------------------------------------------------------
@@ -70,6 +173,31 @@ def _cleanup_store() -> None:
         REPORT_STORE.pop(rid, None)
 
 
+# ---------------------------------------------------------------------------
+# Short-lived /run results — lets /pdf/{report_id} render without a re-POST
+# ---------------------------------------------------------------------------
+
+RUN_REPORT_STORE: dict[str, dict[str, Any]] = {}
+RUN_REPORT_TTL_SECONDS = 15 * 60
+RUN_REPORT_MAX_ENTRIES = 2048
+
+
+def _cleanup_run_store() -> None:
+    # Entries are kept in insertion order with a fixed TTL, so expired (or
+    # over-capacity) records are always at the front.
+    now = time.time()
+    while RUN_REPORT_STORE:
+        rid, rec = next(iter(RUN_REPORT_STORE.items()))
+        if len(RUN_REPORT_STORE) <= RUN_REPORT_MAX_ENTRIES and now - rec["created_at"] <= RUN_REPORT_TTL_SECONDS:
+            break
+        del RUN_REPORT_STORE[rid]
+
+
+def _store_run_report(report_id: str, report: dict[str, Any]) -> None:
+    RUN_REPORT_STORE[report_id] = {"created_at": time.time(), "report": report}
+    _cleanup_run_store()
+
+
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
@@ -139,8 +267,19 @@ def _build_preview_copy(verdict_class: Optional[str]) -> tuple[str, str]:
 # Request / response models
 # ---------------------------------------------------------------------------
 
-class AnalysisRequest(BaseModel):
-    inputs: Dict[str, Any]
+async def analysis_inputs(request: Request) -> Dict[str, Any]:
+    """
+    Reads `{"inputs": {...}}` (or a bare inputs object) straight from the body.
+    run_analysis does all field validation, so a Pydantic model adds nothing here.
+    """
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="Request body must be valid JSON.")
+    inputs = body.get("inputs", body) if isinstance(body, dict) else None
+    if not isinstance(inputs, dict):
+        raise HTTPException(status_code=422, detail="'inputs' must be a JSON object.")
+    return inputs
 
 
 class EmailReportRequest(BaseModel):
@@ -169,10 +308,17 @@ def health():
     return {"status": "ok"}
 
 
+# run_analysis is memoised and costs well under a millisecond, so the async
+# endpoints call it inline; only PDF rendering is pushed to the threadpool.
+
 @app.post("/run")
-def run(req: AnalysisRequest):
+async def run(inputs: Dict[str, Any] = Depends(analysis_inputs)):
     try:
-        return run_analysis(req.inputs)
+        report = run_analysis(inputs)
+        report_id = uuid.uuid4().hex
+        _store_run_report(report_id, report)
+        # Returned directly so the report skips the jsonable_encoder walk
+        return ORJSONResponse({"report_id": report_id, **report})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -180,7 +326,7 @@ def run(req: AnalysisRequest):
 
 
 @app.post("/generate")
-def generate(req: AnalysisRequest, db: Session = Depends(get_db)):
+def generate(inputs: Dict[str, Any] = Depends(analysis_inputs), db: Session = Depends(get_db)):
     """
     Runs the analysis, builds the PDF, stores result in Postgres + in-memory cache.
     Returns reportId + verdictClass to the frontend.
@@ -188,8 +334,8 @@ def generate(req: AnalysisRequest, db: Session = Depends(get_db)):
     try:
         _cleanup_store()
 
-        report = run_analysis(req.inputs)
-        pdf_bytes = build_pdf(report)
+        report = run_analysis(inputs)
+        pdf_bytes = _render_pdf_blocking(report)
         report_id = uuid.uuid4().hex
 
         verdict_class, _ = _extract_verdict(report)
@@ -197,8 +343,6 @@ def generate(req: AnalysisRequest, db: Session = Depends(get_db)):
         payback = _extract_payback(report)
         npv = _extract_npv(report)
 
-        inputs = req.inputs
-
         # Persist to Postgres (anonymous — no PII at this stage)
         calc = Calculation(
             id=report_id,
@@ -494,15 +638,15 @@ def _send_installer_notification(lead: Lead, db: Session) -> None:
 # ---------------------------------------------------------------------------
 
 @app.post("/pdf")
-def pdf(
-    req: AnalysisRequest,
+async def pdf(
+    inputs: Dict[str, Any] = Depends(analysis_inputs),
     x_clearheat_pdf_key: str | None = Header(default=None),
 ):
     if not PDF_KEY or x_clearheat_pdf_key != PDF_KEY:
         raise HTTPException(status_code=401, detail="Unauthorized")
     try:
-        report = run_analysis(req.inputs)
-        pdf_bytes = build_pdf(report)
+        report = run_analysis(inputs)
+        pdf_bytes = await _render_pdf(report)
         return Response(
             content=pdf_bytes,
             media_type="application/pdf",
@@ -512,3 +656,28 @@ def pdf(
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal error: {e}")
+
+
+@app.get("/pdf/{report_id}")
+async def pdf_for_run(
+    report_id: str,
+    x_clearheat_pdf_key: str | None = Header(default=None),
+):
+    """PDF for a report produced by /run in the last few minutes, by its report_id."""
+    if not PDF_KEY or x_clearheat_pdf_key != PDF_KEY:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+    _cleanup_run_store()
+
+    rec = RUN_REPORT_STORE.get(report_id)
+    if not rec:
+        raise HTTPException(status_code=404, detail="Report not found or expired")
+
+    try:
+        pdf_bytes = await _render_pdf(rec["report"])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {e}")
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={"Content-Disposition": "attachment; filename=clearheat_report.pdf"},
+    )
@@ -3,8 +3,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Tuple, Optional, List
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Optional, List
+import copy
 import math
 import json
 
@@ -12,6 +15,48 @@ import json
 # -----------------------------
 # Core heuristics (screening-level)
 # -----------------------------
+# Lookup tables are built once at import and frozen. The helpers below expect
+# inputs already normalised by validate_and_normalize_inputs (no string cleanup).
+
+# Space heating delivered heat intensity (kWh_th/m²·yr) by BER band
+BER_INTENSITY: Mapping[str, Tuple[float, float, float]] = MappingProxyType({
+    "A": (20, 35, 55),
+    "B": (40, 65, 90),
+    "C": (70, 110, 150),
+    "D": (120, 170, 230),
+    "E": (180, 250, 330),
+    "F": (260, 350, 460),
+    "G": (350, 500, 650),
+})
+
+# SCOP (low, typical, high) by emitters, then flow temperature capability
+SCOP_TABLE: Mapping[str, Mapping[str, Tuple[float, float, float]]] = MappingProxyType({
+    # UFH generally supports low flow temps; still leave modest uncertainty
+    "ufh": MappingProxyType({
+        "low":    (2.9, 3.3, 3.8),
+        "medium": (3.2, 3.6, 4.2),
+        "high":   (3.4, 3.8, 4.4),
+    }),
+    # Radiators are the pivot: flow temperature dominates seasonal efficiency.
+    "radiators": MappingProxyType({
+        "low":    (2.0, 2.5, 3.0),   # likely high flow temps needed / small rads / poor fabric
+        "medium": (2.4, 2.9, 3.4),
+        "high":   (2.8, 3.3, 3.8),   # likely ≤45°C capability / oversized radiators / well-insulated
+    }),
+})
+
+HEATING_PATTERN_MULTIPLIER: Mapping[str, float] = MappingProxyType({
+    "rare": 0.55,     # partial / occasional heating
+    "normal": 1.00,   # typical standard pattern
+    "high": 1.20,     # comfort-driven / often on
+})
+
+WOOD_OFFSET_KWH_TH: Mapping[str, float] = MappingProxyType({
+    "none": 0.0,
+    "some": 5000.0,
+    "lots": 10000.0,
+})
+
 
 def ber_to_space_heat_intensity_kwh_m2_yr(ber_band: str) -> Tuple[float, float, float]:
     """
@@ -19,19 +64,10 @@ def ber_to_space_heat_intensity_kwh_m2_yr(ber_band: str) -> Tuple[float, float,
     Practical screening band (not an official BER formula).
     Returns (best, typical, worst).
     """
-    b = ber_band.strip().upper()
-    table = {
-        "A": (20, 35, 55),
-        "B": (40, 65, 90),
-        "C": (70, 110, 150),
-        "D": (120, 170, 230),
-        "E": (180, 250, 330),
-        "F": (260, 350, 460),
-        "G": (350, 500, 650),
-    }
-    if b not in table:
-        raise ValueError("BER band must be one of A, B, C, D, E, F, G.")
-    return table[b]
+    try:
+        return BER_INTENSITY[ber_band]
+    except KeyError:
+        raise ValueError("BER band must be one of A, B, C, D, E, F, G.") from None
 
 
 def emitter_to_scop_range(emitters: str) -> Tuple[float, float, float]:
@@ -39,12 +75,10 @@ def emitter_to_scop_range(emitters: str) -> Tuple[float, float, float]:
     Simple SCOP range depending on emitters (screening).
     Returns (low, typical, high).
     """
-    e = emitters.strip().lower()
-    if e == "ufh":
-        return (3.2, 3.6, 4.2)
-    if e == "radiators":
-        return (2.4, 2.9, 3.4)
-    raise ValueError("emitters must be 'radiators' or 'ufh'.")
+    try:
+        return SCOP_TABLE[emitters]["medium"]
+    except KeyError:
+        raise ValueError("emitters must be 'radiators' or 'ufh'.") from None
 
 
 def adjusted_scop_range(emitters: str, flow_temp_capability: str) -> Tuple[float, float, float]:
@@ -53,43 +87,24 @@ def adjusted_scop_range(emitters: str, flow_temp_capability: str) -> Tuple[float
     - flow_temp_capability: 'low' | 'medium' | 'high'
     For UFH, we keep a tight, generally higher range (flow temp is typically lower).
     """
-    e = emitters.strip().lower()
-    ft = (flow_temp_capability or "medium").strip().lower()
-    if ft not in {"low", "medium", "high"}:
-        raise ValueError("flow_temp_capability must be 'low', 'medium', or 'high'.")
-
-    if e == "ufh":
-        # UFH generally supports low flow temps; still leave modest uncertainty
-        if ft == "low":
-            return (2.9, 3.3, 3.8)
-        if ft == "high":
-            return (3.4, 3.8, 4.4)
-        return (3.2, 3.6, 4.2)
-
-    if e == "radiators":
-        # Radiators are the pivot: flow temperature dominates seasonal efficiency.
-        if ft == "high":   # likely ≤45°C capability / oversized radiators / well-insulated
-            return (2.8, 3.3, 3.8)
-        if ft == "low":    # likely high flow temps needed / small rads / poor fabric
-            return (2.0, 2.5, 3.0)
-        return (2.4, 2.9, 3.4)
-
-    raise ValueError("emitters must be 'radiators' or 'ufh'.")
+    try:
+        by_flow_temp = SCOP_TABLE[emitters]
+    except KeyError:
+        raise ValueError("emitters must be 'radiators' or 'ufh'.") from None
+    try:
+        return by_flow_temp[flow_temp_capability]
+    except KeyError:
+        raise ValueError("flow_temp_capability must be 'low', 'medium', or 'high'.") from None
 
 
 def heating_pattern_multiplier(pattern: str) -> float:
     """
     Behavioural slider applied to BER-based *space heating only*.
     """
-    p = pattern.strip().lower()
-    presets = {
-        "rare": 0.55,     # partial / occasional heating
-        "normal": 1.00,   # typical standard pattern
-        "high": 1.20,     # comfort-driven / often on
-    }
-    if p not in presets:
-        raise ValueError("heating_pattern must be 'rare', 'normal', or 'high'.")
-    return presets[p]
+    try:
+        return HEATING_PATTERN_MULTIPLIER[pattern]
+    except KeyError:
+        raise ValueError("heating_pattern must be 'rare', 'normal', or 'high'.") from None
 
 
 def wood_offset_kwh_th_per_year(wood_use: str) -> float:
@@ -97,15 +112,10 @@ def wood_offset_kwh_th_per_year(wood_use: str) -> float:
     Delivered heat from wood stoves (kWh_th/yr), used ONLY for BER-based path.
     Bills-based already reflects real behaviour, so we don't apply this offset there.
     """
-    w = wood_use.strip().lower()
-    presets = {
-        "none": 0.0,
-        "some": 5000.0,
-        "lots": 10000.0,
-    }
-    if w not in presets:
-        raise ValueError("wood_use must be 'none', 'some', or 'lots'.")
-    return presets[w]
+    try:
+        return WOOD_OFFSET_KWH_TH[wood_use]
+    except KeyError:
+        raise ValueError("wood_use must be 'none', 'some', or 'lots'.") from None
 
 
 def dhw_band_kwh_th_per_year(occupants: int) -> Tuple[float, float, float]:
@@ -142,6 +152,28 @@ def band_hp_costs_from_heat(
             E_worst* elec_price_eur_per_kwh)
 
 
+def scenario_results(
+    heat_kwh_th: Tuple[float, float, float],
+    current_cost_eur: Tuple[float, float, float],
+    hp_cost_eur: Tuple[float, float, float],
+    savings_eur: Tuple[float, float, float],
+    payback: Tuple[Optional[float], ...],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Unpack (best, typical, worst) bands into the report's per-scenario dicts.
+    """
+    return {
+        name: {
+            "heat_kwh_th": heat_kwh_th[i],
+            "current_cost_eur": current_cost_eur[i],
+            "hp_cost_eur": hp_cost_eur[i],
+            "savings_eur": savings_eur[i],
+            "payback_years": to_payback_or_none(payback[i]),  # None when no quote
+        }
+        for i, name in enumerate(("best", "typical", "worst"))
+    }
+
+
 def payback_years(capex_eur: float, annual_savings_eur: float) -> float:
     return math.inf if annual_savings_eur <= 0 else capex_eur / annual_savings_eur
 
@@ -539,14 +571,35 @@ def validate_and_normalize_inputs(inputs: Dict[str, Any]) -> Dict[str, Any]:
 # Analysis engine
 # -----------------------------
 
+ANALYSIS_CACHE_SIZE = 1024
+
+
 def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
     """
     Website-ready engine function.
     - No input() calls
     - No prints
     - Returns a report dict suitable for JSON + PDF generation
+
+    Reports are memoised on the normalised inputs, so /run followed by /pdf with
+    the same form only computes once. Only the top level and "meta" are fresh per
+    call; treat the nested sections as read-only.
     """
     inputs = validate_and_normalize_inputs(raw_inputs)
+    cached = _run_analysis_cached(tuple(sorted(inputs.items())))
+
+    report = copy.copy(cached)
+    report["meta"] = {
+        **cached["meta"],
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    return report
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _run_analysis_cached(frozen_inputs: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """Pure analysis over already-normalised inputs (all values are hashable primitives)."""
+    inputs = dict(frozen_inputs)
 
     ber = inputs["ber_band"]
     area = inputs["floor_area_m2"]
@@ -574,6 +627,16 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
     ber_intensity = ber_to_space_heat_intensity_kwh_m2_yr(ber)
     wood_kwh = wood_offset_kwh_th_per_year(wood_use)
 
+    bill_mode = inputs["bill_mode"]
+    bills_available = bill_mode != "none"
+
+    if fuel_type == "kerosene":
+        kwh_per_unit = 10.0
+        fuel_unit = "L"
+    else:
+        kwh_per_unit = 1.0
+        fuel_unit = "kWh"
+
     # -------------------------
     # Path B: BER-based (always available)
     # -------------------------
@@ -587,14 +650,8 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
     )
 
     # Current cost estimate from BER-based heat
-    if fuel_type == "kerosene":
-        litres = tuple((Q_total_ber[i] / boiler_eff) / 10.0 for i in range(3))
-        Ccur_ber = tuple(litres[i] * fuel_price for i in range(3))
-        fuel_unit = "L"
-    else:
-        gas_kwh = tuple((Q_total_ber[i] / boiler_eff) for i in range(3))
-        Ccur_ber = tuple(gas_kwh[i] * fuel_price for i in range(3))
-        fuel_unit = "kWh"
+    fuel_units_ber = tuple((Q_total_ber[i] / boiler_eff) / kwh_per_unit for i in range(3))
+    Ccur_ber = tuple(fuel_units_ber[i] * fuel_price for i in range(3))
 
     Chp_ber = band_hp_costs_from_heat(Q_total_ber, scop_rng, elec_price)
     savings_ber = tuple(Ccur_ber[i] - Chp_ber[i] for i in range(3))
@@ -603,8 +660,6 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
     # -------------------------
     # Path A: Bills-based (optional)
     # -------------------------
-    bill_mode = inputs["bill_mode"]
-    bills_available = bill_mode != "none"
     Q_total_bill: Optional[Tuple[float, float, float]] = None
     Ccur_bill: Optional[Tuple[float, float, float]] = None
     Chp_bill: Optional[Tuple[float, float, float]] = None
@@ -613,13 +668,6 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
     anchor: Dict[str, Any] = {"mode": None, "annual_units": None, "annual_spend_eur": None}
 
     if bills_available:
-        if fuel_type == "kerosene":
-            kwh_per_unit = 10.0
-            unit_name = "L"
-        else:
-            kwh_per_unit = 1.0
-            unit_name = "kWh"
-
         if bill_mode == "annual_fuel_use":
             annual_units = float(inputs["annual_fuel_use"])
             if annual_units < 0:
@@ -662,7 +710,7 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
     # Verdict + key drivers (verdict-first product layer)
     # -------------------------
 
-    if bills_available and savings_bill:
+    if bills_available and savings_bill is not None:
         primary_label = "bills_based"
         primary_reason = "Bills provided — estimate anchored to real usage."
         savings_primary = savings_bill
@@ -673,7 +721,11 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
         savings_primary = savings_ber
         payback_primary = payback_ber
 
-    outcomes_primary = [outcome_from_savings(s) for s in savings_primary]
+    # Unpack the primary band once; everything below works on plain floats
+    sav_best, sav_typ, sav_worst = savings_primary
+    pb_best, pb_typ, pb_worst = payback_primary
+
+    outcomes_primary = [outcome_from_savings(sav_best), outcome_from_savings(sav_typ), outcome_from_savings(sav_worst)]
     verdict = verdict_from_outcomes(outcomes_primary)
 
     # Existing qualitative confidence (kept for continuity; numeric score will drive final label)
@@ -685,7 +737,7 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
     verdict_ber_for_score: Optional[str] = None
     verdict_bill_for_score: Optional[str] = None
 
-    if bills_available and savings_bill:
+    if bills_available and savings_bill is not None:
         outcomes_ber = [outcome_from_savings(s) for s in savings_ber]
         verdict_ber = verdict_from_outcomes(outcomes_ber)
         outcomes_bill = [outcome_from_savings(s) for s in savings_bill]
@@ -710,21 +762,22 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
         notes.append("Bills not provided; BER-based method used as the primary estimate.")
 
     # Typical figures (primary method)
-    typ_savings = float(savings_primary[1])
-    _pp1 = payback_primary[1] if payback_primary else None
-    typ_payback = None if _pp1 is None else float(_pp1)
+    typ_savings = sav_typ
+    typ_payback = None if pb_typ is None else float(pb_typ)
 
     # -------------------------
     # Affordable capex table (always computed)
     # For each payback horizon, what net capex can savings justify?
     # -------------------------
     affordable: Dict[str, Any] = {}
+    grant_deduction = grant_value if grant_applied else 0.0
+    savings_by_scenario = (("best", sav_best), ("typical", sav_typ), ("worst", sav_worst))
     for horizon in PAYBACK_HORIZONS:
         key = f"{horizon}yr"
         affordable[key] = {}
-        for sc_name, s_val in [("best", savings_primary[0]), ("typical", savings_primary[1]), ("worst", savings_primary[2])]:
-            gross = max(0.0, float(s_val) * horizon)
-            net = max(0.0, gross - (grant_value if grant_applied else 0.0))
+        for sc_name, s_val in savings_by_scenario:
+            gross = max(0.0, s_val * horizon)
+            net = max(0.0, gross - grant_deduction)
             affordable[key][sc_name] = {
                 "affordable_gross_eur": int(round(gross)),
                 "affordable_net_eur": int(round(net)),
@@ -934,7 +987,6 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
         "meta": {
             "tool_version": "engine_v2",
             "currency": "EUR",
-            "generated_at_utc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         },
         "inputs": {
             "ber_band": ber,
@@ -981,29 +1033,7 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
             ],
         },
         "results": {
-            "ber_based": {
-                "best": {
-                    "heat_kwh_th": Q_total_ber[0],
-                    "current_cost_eur": Ccur_ber[0],
-                    "hp_cost_eur": Chp_ber[0],
-                    "savings_eur": savings_ber[0],
-                    "payback_years": to_payback_or_none(payback_ber[0]),  # None when no quote
-                },
-                "typical": {
-                    "heat_kwh_th": Q_total_ber[1],
-                    "current_cost_eur": Ccur_ber[1],
-                    "hp_cost_eur": Chp_ber[1],
-                    "savings_eur": savings_ber[1],
-                    "payback_years": to_payback_or_none(payback_ber[1]),
-                },
-                "worst": {
-                    "heat_kwh_th": Q_total_ber[2],
-                    "current_cost_eur": Ccur_ber[2],
-                    "hp_cost_eur": Chp_ber[2],
-                    "savings_eur": savings_ber[2],
-                    "payback_years": to_payback_or_none(payback_ber[2]),
-                },
-            },
+            "ber_based": scenario_results(Q_total_ber, Ccur_ber, Chp_ber, savings_ber, payback_ber),
             "bills_based": {
                 "available": bills_available,
                 "anchor": anchor,
@@ -1062,30 +1092,10 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
         "disclaimer": "Screening estimate only. Not a substitute for a detailed design survey.",
     }
 
-    if bills_available and Q_total_bill and Ccur_bill and Chp_bill and savings_bill and payback_bill:
-        report["results"]["bills_based"].update({
-            "best": {
-                "heat_kwh_th": Q_total_bill[0],
-                "current_cost_eur": Ccur_bill[0],
-                "hp_cost_eur": Chp_bill[0],
-                "savings_eur": savings_bill[0],
-                "payback_years": to_payback_or_none(payback_bill[0]),
-            },
-            "typical": {
-                "heat_kwh_th": Q_total_bill[1],
-                "current_cost_eur": Ccur_bill[1],
-                "hp_cost_eur": Chp_bill[1],
-                "savings_eur": savings_bill[1],
-                "payback_years": to_payback_or_none(payback_bill[1]),
-            },
-            "worst": {
-                "heat_kwh_th": Q_total_bill[2],
-                "current_cost_eur": Ccur_bill[2],
-                "hp_cost_eur": Chp_bill[2],
-                "savings_eur": savings_bill[2],
-                "payback_years": to_payback_or_none(payback_bill[2]),
-            },
-        })
+    if Q_total_bill is not None and Ccur_bill is not None and Chp_bill is not None and savings_bill is not None and payback_bill:
+        report["results"]["bills_based"].update(
+            scenario_results(Q_total_bill, Ccur_bill, Chp_bill, savings_bill, payback_bill)
+        )
 
     # When user provided a quote, add a personalised payback section
     if quote_provided and capex is not None:
@@ -1094,9 +1104,9 @@ def run_analysis(raw_inputs: Dict[str, Any]) -> Dict[str, Any]:
             "grant_value_eur": grant_value if grant_applied else 0.0,
             "hp_quote_eur": hp_quote,
             "payback_years": {
-                "best":    to_payback_or_none(payback_primary[0]),
-                "typical": to_payback_or_none(payback_primary[1]),
-                "worst":   to_payback_or_none(payback_primary[2]),
+                "best":    to_payback_or_none(pb_best),
+                "typical": to_payback_or_none(pb_typ),
+                "worst":   to_payback_or_none(pb_worst),
             },
         }
 
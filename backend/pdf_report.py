@@ -11,16 +11,25 @@
 
 from __future__ import annotations
 
-from io import BytesIO
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from typing import Any, Dict, List, Optional, Tuple
 import re
 
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.lib.colors import HexColor, Color
-from reportlab.pdfgen import canvas
+from reportlab.lib import rl_accel
+from reportlab.pdfgen import canvas, textobject
 from reportlab.pdfbase import pdfmetrics
 
+# Streams are Flate-compressed; ReportLab would also ASCII85-encode them (in
+# pure Python), making them ~25% larger for no benefit over HTTP. Set once at
+# import: rl_config is process-wide and build_pdf runs on several threads.
+rl_config.useA85 = 0
+
 
 # =========================
 # Brand palette
@@ -35,45 +44,139 @@ COLOR_GREEN   = HexColor("#2E7D32")
 COLOR_AMBER   = HexColor("#ED6C02")
 COLOR_RED     = HexColor("#C62828")
 
+# Millimetre offsets used by the helpers and page layout below
+MM_2   = 2 * mm
+MM_3   = 3 * mm
+MM_3_5 = 3.5 * mm
+MM_4   = 4 * mm
+MM_5   = 5 * mm
+MM_6   = 6 * mm
+MM_6_5 = 6.5 * mm
+MM_7   = 7 * mm
+MM_7_5 = 7.5 * mm
+MM_8   = 8 * mm
+MM_9   = 9 * mm
+MM_10  = 10 * mm
+MM_12  = 12 * mm
+MM_14  = 14 * mm
+
+# Page geometry (every report is A4 with the same margins)
+A4_W, A4_H = A4
+MARGIN = 16 * mm
+USABLE_W = A4_W - 2 * MARGIN
+CONTENT_TOP = A4_H - MARGIN - MM_12  # first baseline below the header
+
+
+# =========================
+# Canvas
+# =========================
+class SnappedTextObject(textobject.PDFTextObject):
+    """Text object whose origins are rounded to 0.1 pt.
+
+    Layout maths in mm leaves coordinates like 509.0013; a tenth of a point
+    is far below anything visible and keeps the Tm operands short.
+    """
+
+    def setTextOrigin(self, x, y):
+        super().setTextOrigin(round(x, 1), round(y, 1))
+
+
+class StatefulCanvas(canvas.Canvas):
+    """Canvas that drops fill/stroke/font changes which would not change anything.
+
+    The helpers below set colour and font before every string they draw, so
+    most calls repeat the current state. The comparison is against ReportLab's
+    own tracked state, which saveState/restoreState and showPage already keep
+    in step with the PDF graphics state. A colour carrying an alpha is only
+    skipped when the current fill/stroke alpha matches it.
+    """
+
+    def setFillColor(self, aColor, alpha=None):
+        if (
+            alpha is None
+            and aColor is self._fillColorObj
+            and getattr(aColor, "alpha", None) in (None, self._extgstate.getValue("ca"))
+        ):
+            return
+        super().setFillColor(aColor, alpha)
+
+    def setStrokeColor(self, aColor, alpha=None):
+        if (
+            alpha is None
+            and aColor is self._strokeColorObj
+            and getattr(aColor, "alpha", None) in (None, self._extgstate.getValue("CA"))
+        ):
+            return
+        super().setStrokeColor(aColor, alpha)
+
+    def setFont(self, psfontname, size, leading=None):
+        if (
+            psfontname == self._fontname
+            and size == self._fontsize
+            and (size * 1.2 if leading is None else leading) == self._leading
+        ):
+            return
+        super().setFont(psfontname, size, leading)
+
+    def beginText(self, x=0, y=0, direction=None):
+        # drawString/drawRightString/drawCentredString all come through here
+        return SnappedTextObject(self, x, y, direction=direction)
+
 
 # =========================
 # Formatting helpers
 # =========================
 ACRONYMS = {"NPV", "SCOP", "COP", "BER", "DHW", "SEAI", "KWH", "KWH/YR"}
 
+_NUM_FMTS = {0: "{:.0f}", 1: "{:.1f}", 2: "{:.2f}"}
+_INF = float("inf")
+
+# The formatters below take floats straight through and only call float() for
+# other types (ints, numeric strings, NumPy/Decimal scalars); None short-circuits.
+
 def eur(x: Any) -> str:
     """Format EUR with visible negative sign (space after sign)."""
-    try:
-        v = float(x)
-        if v < 0:
-            return f"- €{abs(v):,.0f}"
-        return f"€{v:,.0f}"
-    except Exception:
-        return "—"
+    if not isinstance(x, float):
+        if x is None:
+            return "—"
+        try:
+            x = float(x)
+        except (TypeError, ValueError, OverflowError):
+            return "—"
+    if x < 0:
+        return f"- €{-x:,.0f}"
+    return f"€{x:,.0f}"
 
 def num(x: Any, unit: str = "", decimals: int = 0) -> str:
-    try:
-        v = float(x)
-        fmt = f"{{:.{decimals}f}}"
-        s = fmt.format(v)
-        return f"{s}{(' ' + unit) if unit else ''}"
-    except Exception:
-        return "—"
+    if not isinstance(x, float):
+        if x is None:
+            return "—"
+        try:
+            x = float(x)
+        except (TypeError, ValueError, OverflowError):
+            return "—"
+    fmt = _NUM_FMTS.get(decimals)
+    s = fmt.format(x) if fmt else f"{x:.{decimals}f}"
+    return f"{s} {unit}" if unit else s
 
 def years_text(x: Any) -> str:
-    if x is None:
-        return "—"
-    try:
-        v = float(x)
-        if v != v or v == float("inf"):
-            return "No Payback"
-        if v > 99:
-            return ">99"
-        if abs(v - round(v)) < 1e-9:
-            return f"{int(round(v))}"
-        return f"{v:.1f}"
-    except Exception:
+    if not isinstance(x, float):
+        if x is None:
+            return "—"
+        try:
+            x = float(x)
+        except (TypeError, ValueError, OverflowError):
+            return "—"
+    if x != x or x == _INF:
+        return "No Payback"
+    if x > 99:
+        return ">99"
+    if x == -_INF:
         return "—"
+    r = round(x)
+    if abs(x - r) < 1e-9:
+        return f"{r}"
+    return _NUM_FMTS[1].format(x)
 
 def safe_float(x: Any) -> Optional[float]:
     try:
@@ -139,39 +242,118 @@ def sentence_case_keep_acronyms(s: str) -> str:
 # =========================
 # Text wrapping
 # =========================
-def _wrap_lines(text: str, font_name: str, font_size: float, max_width: float) -> List[str]:
-    text = (text or "").replace("\r\n", "\n").replace("\r", "\n")
+# Per-font character widths in glyph units (1/1000 em). ReportLab sizes
+# standard-font text as sum(glyph widths) * 0.001 * size, so summing cached
+# units and scaling the same way gives identical line breaks without
+# re-measuring every trial line.
+_WIDTH_CACHE: Dict[str, Dict[str, float]] = {}
+
+def _char_units(font_name: str) -> Dict[str, float]:
+    return _WIDTH_CACHE.setdefault(font_name, {})
+
+# Nearly all report text is ASCII: a 128-entry table per font, indexed by the
+# bytes of the paragraph, avoids per-character dict lookups and the check for
+# unmeasured glyphs. A list rather than array("d") so reads do not re-box floats.
+# The widest ASCII glyph bounds a paragraph's width by its length alone.
+_ASCII_WIDTH_CACHE: Dict[str, Tuple[List[float], float]] = {}
+
+def _ascii_units(font_name: str) -> Tuple[List[float], float]:
+    entry = _ASCII_WIDTH_CACHE.get(font_name)
+    if entry is None:
+        table = [round(pdfmetrics.stringWidth(chr(i), font_name, 1000), 6) for i in range(128)]
+        entry = _ASCII_WIDTH_CACHE[font_name] = (table, max(table))
+    return entry
+
+REPORT_FONTS = ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique")
+
+def warm_up() -> None:
+    """Load font metrics and width tables ahead of the first report in a process.
+
+    A canvas is single-use (getpdfdata() finalises its document) and costs
+    ~30 us to create, so there is nothing worth pooling per call; what is
+    reusable already lives at module level and only needs filling once.
+    """
+    for font_name in REPORT_FONTS:
+        pdfmetrics.getFont(font_name)
+        _ascii_units(font_name)
+
+def accelerated() -> bool:
+    """True if ReportLab loaded its _rl_accel C extension (rl_accel in requirements.txt).
+
+    reportlab.lib.rl_accel silently falls back to pure Python when the wheel is
+    missing or broken, so check that fp_str (hot in every content stream) is
+    the C builtin.
+    """
+    return getattr(rl_accel.fp_str, "__module__", None) == "_rl_accel"
+
+# Wrapped lines are memoised: headings, labels, methodology/disclaimer text and
+# most bullets repeat across (and within) reports. Results are immutable tuples.
+@lru_cache(maxsize=2048)
+def _wrap_lines(text: str, font_name: str, font_size: float, max_width: float) -> Tuple[str, ...]:
+    units = _char_units(font_name)
+    ascii_units, widest_u = _ascii_units(font_name)
+
+    def measure(chars: str) -> None:
+        for ch in set(chars).difference(units):
+            units[ch] = round(pdfmetrics.stringWidth(ch, font_name, 1000), 6)
+
+    def fits(u: float) -> bool:
+        return u * 0.001 * font_size <= max_width
+
+    text = text or ""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
     out: List[str] = []
-    for para in text.split("\n"):
-        para = para.strip()
+    limit_u = max_width / (0.001 * font_size) if font_size > 0 else float("inf")
+    for para in text.split("\n") if "\n" in text else (text,):
+        para = " ".join(para.split())
         if not para:
             out.append("")
             continue
-        words = para.split()
-        line = ""
-        for w in words:
-            trial = w if not line else f"{line} {w}"
-            if pdfmetrics.stringWidth(trial, font_name, font_size) <= max_width:
-                line = trial
+        # Prefix sums of glyph units: the width of para[i:j] is pre[j] - pre[i],
+        # so trial lines are measured by index without slicing the paragraph.
+        # Standard-font widths are whole units, so the differences are exact.
+        if para.isascii():
+            # Headings and labels usually fit even at the widest glyph's width
+            if fits(len(para) * widest_u):
+                out.append(para)
+                continue
+            widths = map(ascii_units.__getitem__, para.encode("ascii"))
+        else:
+            measure(para)
+            widths = map(units.__getitem__, para)
+        pre = list(accumulate(widths, initial=0.0))
+        if fits(pre[-1]):
+            out.append(para)
+            continue
+
+        n = len(para)
+        i = 0
+        while i < n:
+            base = pre[i]
+            # Binary search the prefix sums for the last glyph that fits; the
+            # unit limit is only approximate, so settle the edge with fits()
+            j = max(i, bisect_right(pre, base + limit_u, i, n + 1) - 1)
+            while j < n and fits(pre[j + 1] - base):
+                j += 1
+            while j > i and not fits(pre[j] - base):
+                j -= 1
+            if j == i:
+                j = i + 1  # a single glyph wider than the line still has to go somewhere
+
+            if j == n or para[j] == " ":
+                out.append(para[i:j])
+                i = j + 1
+                continue
+            # Mid-word: break at the last space, or split an over-long word
+            k = para.rfind(" ", i, j)
+            if k != -1:
+                out.append(para[i:k])
+                i = k + 1
             else:
-                if line:
-                    out.append(line)
-                if pdfmetrics.stringWidth(w, font_name, font_size) <= max_width:
-                    line = w
-                else:
-                    chunk = ""
-                    for ch in w:
-                        trial2 = chunk + ch
-                        if pdfmetrics.stringWidth(trial2, font_name, font_size) <= max_width:
-                            chunk = trial2
-                        else:
-                            if chunk:
-                                out.append(chunk)
-                            chunk = ch
-                    line = chunk
-        if line:
-            out.append(line)
-    return out
+                out.append(para[i:j])
+                i = j
+    return tuple(out)
 
 def draw_wrapped(
     c: canvas.Canvas,
@@ -188,11 +370,28 @@ def draw_wrapped(
     t = sentence_case_keep_acronyms(text) if sentence_case else text
     c.setFillColor(color)
     c.setFont(font, size)
+    # One BT/ET block for the whole paragraph; T* steps down by the leading.
+    tobj = c.beginText(x, y)
+    tobj.setLeading(leading)
     for line in _wrap_lines(t, font, size, max_width):
-        c.drawString(x, y, line)
+        tobj.textLine(line)
         y -= leading
+    c.drawText(tobj)
     return y
 
+def draw_text_object(c: canvas.Canvas, tobj: Any) -> None:
+    """Emit a text object that may have changed fill colour or font.
+
+    Tf/rg set inside BT..ET persist in the PDF graphics state, but the canvas
+    does not see them; re-stating them here keeps StatefulCanvas from skipping
+    a later change it believes is redundant.
+    """
+    c.drawText(tobj)
+    fill = getattr(tobj, "_fillColorObj", None)
+    if fill is not None:
+        c.setFillColor(fill)
+    c.setFont(tobj._fontname, tobj._fontsize, tobj._leading)
+
 def draw_bullets(
     c: canvas.Canvas,
     x: float,
@@ -202,22 +401,50 @@ def draw_bullets(
     font: str = "Helvetica",
     size: float = 10,
     leading: float = 13,
-    bullet_indent: float = 4 * mm,
+    bullet_indent: float = MM_4,
+    color: Color = COLOR_TEXT,
+) -> float:
+    wrapped = _wrap_bullets(bullets, max_width, font, size, bullet_indent)
+    return _draw_prewrapped_bullets(c, x, y, wrapped, font, size, leading, bullet_indent, color)
+
+def _wrap_bullets(
+    bullets: List[str],
+    max_width: float,
+    font: str = "Helvetica",
+    size: float = 10,
+    bullet_indent: float = MM_4,
+) -> Tuple[Tuple[str, ...], ...]:
+    """Sentence-case and wrap each bullet; bullets that wrap to nothing are dropped."""
+    out = []
+    for b in bullets or []:
+        wrapped = _wrap_lines(sentence_case_keep_acronyms(str(b)), font, size, max_width - bullet_indent - MM_2)
+        if wrapped:
+            out.append(wrapped)
+    return tuple(out)
+
+def _draw_prewrapped_bullets(
+    c: canvas.Canvas,
+    x: float,
+    y: float,
+    wrapped: Tuple[Tuple[str, ...], ...],
+    font: str = "Helvetica",
+    size: float = 10,
+    leading: float = 13,
+    bullet_indent: float = MM_4,
     color: Color = COLOR_TEXT,
 ) -> float:
     c.setFillColor(color)
     c.setFont(font, size)
-    for b in bullets or []:
-        btxt = sentence_case_keep_acronyms(str(b))
-        wrapped = _wrap_lines(btxt, font, size, max_width - bullet_indent - 2 * mm)
-        if not wrapped:
-            continue
-        c.drawString(x, y, "•")
-        c.drawString(x + bullet_indent, y, wrapped[0])
-        y -= leading
-        for line in wrapped[1:]:
-            c.drawString(x + bullet_indent, y, line)
+    tobj = c.beginText(x, y)
+    tobj.setLeading(leading)
+    for lines in wrapped:
+        tobj.setTextOrigin(x, y)
+        tobj.textOut("•")
+        tobj.setTextOrigin(x + bullet_indent, y)
+        for line in lines:
+            tobj.textLine(line)
             y -= leading
+    c.drawText(tobj)
     return y
 
 
@@ -276,6 +503,26 @@ def draw_wordmark(c: canvas.Canvas, x: float, y: float, size: int = 14) -> float
     w_heat = stringWidth("Heat", "Helvetica-Bold", size)
     return x + w_clear + w_heat
 
+def _draw_header_footer_chrome(c: canvas.Canvas, W: float, H: float, margin: float) -> None:
+    """The parts of the header/footer that are the same on every page."""
+    # Header and footer rules in one path
+    c.setStrokeColor(COLOR_LINE)
+    c.setLineWidth(0.8)
+    c.lines([
+        (margin, H - margin + MM_4, W - margin, H - margin + MM_4),
+        (margin, margin - MM_6, W - margin, margin - MM_6),
+    ])
+
+    logo_size = MM_9
+    baseline_y = H - margin + MM_7_5
+    cap_offset = 11 * 0.123 * mm
+    draw_clearheat_logo(c, margin, baseline_y + (logo_size / 2) + cap_offset, size=logo_size, stroke_width=1.4)
+    draw_wordmark(c, margin + logo_size + MM_3_5, baseline_y, size=11)
+
+    c.setFillColor(COLOR_MUTED)
+    c.setFont("Helvetica", 8)
+    c.drawString(margin, margin - MM_10, "Independent heat pump financial screening for Irish homeowners.")
+
 def header_footer(
     c: canvas.Canvas,
     page_num: int,
@@ -285,28 +532,26 @@ def header_footer(
     margin: float,
     subtitle: str,
 ) -> None:
-    c.setStrokeColor(COLOR_LINE)
-    c.setLineWidth(0.8)
-    c.line(margin, H - margin + 4 * mm, W - margin, H - margin + 4 * mm)
-
-    logo_size = 9 * mm
-    baseline_y = H - margin + 7.5 * mm
-    cap_offset = 11 * 0.123 * mm
-    draw_clearheat_logo(c, margin, baseline_y + (logo_size / 2) + cap_offset, size=logo_size, stroke_width=1.4)
-    draw_wordmark(c, margin + logo_size + 3.5 * mm, baseline_y, size=11)
-
+    # Rules, logo, wordmark and tagline are drawn once per document as a form
+    # XObject and referenced from every page; only the subtitle and page
+    # number are drawn per page.
+    chrome = f"ClearHeatChrome{round(W * 100)}x{round(H * 100)}x{round(margin * 100)}"
+    if not c.hasForm(chrome):
+        c.beginForm(chrome)
+        _draw_header_footer_chrome(c, W, H, margin)
+        c.endForm()
+    c.doForm(chrome)
+
+    baseline_y = H - margin + MM_7_5
     c.setFillColor(COLOR_MUTED)
     c.setFont("Helvetica", 9)
     c.drawRightString(W - margin, baseline_y, title_case_keep_acronyms(subtitle))
 
+    # Leave the canvas in the state the inline drawing used to.
     c.setStrokeColor(COLOR_LINE)
     c.setLineWidth(0.8)
-    c.line(margin, margin - 6 * mm, W - margin, margin - 6 * mm)
-
-    c.setFillColor(COLOR_MUTED)
     c.setFont("Helvetica", 8)
-    c.drawString(margin, margin - 10 * mm, "Independent heat pump financial screening for Irish homeowners.")
-    c.drawRightString(W - margin, margin - 10 * mm, f"Page {page_num} of {total_pages}")
+    c.drawRightString(W - margin, margin - MM_10, f"Page {page_num} of {total_pages}")
 
 
 # =========================
@@ -316,12 +561,12 @@ def panel(c: canvas.Canvas, x: float, y_top: float, w: float, h: float) -> None:
     c.setFillColor(COLOR_PANEL)
     c.setStrokeColor(COLOR_LINE)
     c.setLineWidth(0.8)
-    c.roundRect(x, y_top - h, w, h, radius=3 * mm, stroke=1, fill=1)
+    c.roundRect(x, y_top - h, w, h, radius=MM_3, stroke=1, fill=1)
 
 
 def draw_left_accent_bar(
     c: canvas.Canvas, x: float, y_top: float, bar_w: float, bar_h: float,
-    color: Color, radius: float = 3 * mm
+    color: Color, radius: float = MM_3
 ) -> None:
     """Solid bar with rounded corners on the LEFT side only, square on the right."""
     r = min(radius, bar_w / 2, bar_h / 2)
@@ -346,7 +591,7 @@ def section_title(c: canvas.Canvas, x: float, y: float, title: str) -> float:
     c.setFillColor(COLOR_PRIMARY)
     c.setFont("Helvetica-Bold", 13)
     c.drawString(x, y, title_case_keep_acronyms(title))
-    return y - 7 * mm
+    return y - MM_7
 
 def kv_row(c: canvas.Canvas, x: float, y: float, label: str, value: str, w: float) -> float:
     c.setFont("Helvetica", 10)
@@ -356,7 +601,7 @@ def kv_row(c: canvas.Canvas, x: float, y: float, label: str, value: str, w: floa
     c.setFont("Helvetica-Bold", 11)
     c.setFillColor(COLOR_TEXT)
     c.drawRightString(x + w, y, value)
-    return y - 6.5 * mm
+    return y - MM_6_5
 
 
 # =========================
@@ -849,6 +1094,14 @@ def disclaimer_text() -> List[str]:
         "You should obtain a detailed heat loss calculation and competent system design before committing to major spend.",
     ]
 
+# The fixed text of pages 6–7, wrapped once at import for the report's A4 column
+_METHODOLOGY_BULLETS = _wrap_bullets(methodology_text(), USABLE_W)
+_DISCLAIMER_BULLETS = _wrap_bullets(disclaimer_text(), USABLE_W)
+_GLOSSARY_WRAPPED = tuple(
+    (title_case_keep_acronyms(term), _wrap_lines(sentence_case_keep_acronyms(definition), "Helvetica", 9.8, USABLE_W))
+    for term, definition in GLOSSARY
+)
+
 
 # =========================
 # Extraction helpers
@@ -884,7 +1137,7 @@ def draw_bottom_line_callout(
                    else HexColor("#FEEEEE"))
     c.setStrokeColor(accent)
     c.setLineWidth(1.4)
-    c.roundRect(x, y_top - h, w, h, radius=3 * mm, stroke=1, fill=1)
+    c.roundRect(x, y_top - h, w, h, radius=MM_3, stroke=1, fill=1)
     # Left colour bar (rounded left side only)
     draw_left_accent_bar(c, x, y_top, 5 * mm, h, accent)
 
@@ -1145,13 +1398,14 @@ def draw_savings_projection_graph(
 # Public API
 # =========================
 def build_pdf(report: Dict[str, Any]) -> bytes:
-    buf = BytesIO()
-    c = canvas.Canvas(buf, pagesize=A4)
-    W, H = A4
+    # No file/BytesIO target: getpdfdata() hands back the serialised document
+    # directly, avoiding the write into a buffer and the getvalue() copy.
+    c = StatefulCanvas(None, pagesize=A4, pageCompression=1, invariant=0)
+    W, H = A4_W, A4_H
 
-    margin = 16 * mm
+    margin = MARGIN
     x0 = margin
-    usable_w = W - 2 * margin
+    usable_w = USABLE_W
 
     meta = report.get("meta", {}) or {}
     inp = report.get("inputs", {}) or {}
@@ -1169,11 +1423,12 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
     verdict_text_raw = dec.get("verdict_text") or str(dec.get("verdict", "—")).replace("_", " ")
     verdict_text = title_case_keep_acronyms(verdict_text_raw)
 
+    primary_method = get_primary_method(report)
+
     confidence_basis = str(dec.get("confidence_basis", ""))
     if not confidence_basis:
         # Fallback for older engine versions
         conf_level = str(dec.get("confidence_level", "medium"))
-        primary_method = get_primary_method(report)
         if primary_method == "bills_based":
             confidence_basis = "Anchored to your fuel bills — high reliability" if conf_level == "high" else "Anchored to your fuel bills — some uncertainty remains"
         else:
@@ -1181,7 +1436,6 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
 
     accent = verdict_accent(verdict_text)
 
-    primary_method = get_primary_method(report)
     best, typ, worst = scenario_triplet(report, primary_method)
 
     capex = safe_float(inp.get("hp_capex_eur"))  # May be None if no quote
@@ -1191,10 +1445,16 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
     capex_label = dec.get("ref_capex_label")
 
     affordable = dec.get("affordable_capex") or {}
+    affordable_12yr = affordable.get("12yr") or {}
     market_verdict = str(dec.get("market_verdict", ""))
     typical_irish_range = list(dec.get("typical_irish_gross_range") or dec.get("typical_irish_range") or [12000, 18000])
 
     personalised = dec.get("personalised")
+    quote_payback: Optional[Dict[str, Any]] = None
+    quote_net_cost: Optional[float] = None
+    if personalised:
+        quote_payback = personalised.get("payback_years", {})
+        quote_net_cost = safe_float(personalised.get("capex_eur"))
 
     grant_applied = bool(inp.get("grant_applied", True))
     grant_value_eur = safe_float(inp.get("grant_value_eur")) or 0.0
@@ -1226,7 +1486,7 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
     w_clear = stringWidth("Clear", "Helvetica", 28)
     w_heat  = stringWidth("Heat",  "Helvetica-Bold", 28)
     word_w  = w_clear + w_heat
-    y_word  = logo_y_top - logo_size - 5 * mm
+    y_word  = logo_y_top - logo_size - MM_5
     c.setFillColor(COLOR_PRIMARY)
     c.setFont("Helvetica", 28)
     c.drawString(center_x - word_w / 2, y_word, "Clear")
@@ -1234,46 +1494,46 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
     c.drawString(center_x - word_w / 2 + w_clear, y_word, "Heat")
 
     # Report title
-    y = y_word - 14 * mm
+    y = y_word - MM_14
     c.setFillColor(COLOR_TEXT)
     c.setFont("Helvetica-Bold", 15)
     c.drawCentredString(center_x, y, "Heat Pump Financial Screening Report")
 
     # Thin rule
-    y -= 7 * mm
+    y -= MM_7
     c.setStrokeColor(COLOR_LINE)
     c.setLineWidth(1.0)
     c.line(center_x - 50 * mm, y, center_x + 50 * mm, y)
 
     # Report metadata
-    y -= 8 * mm
+    y -= MM_8
     c.setFillColor(COLOR_MUTED)
     c.setFont("Helvetica", 10)
     c.drawCentredString(center_x, y, f"Report ID: {report_id}   ·   Generated: {gen_date}")
 
     # Verdict teaser panel on cover
     teaser_h = 22 * mm
-    teaser_y = y - 14 * mm
+    teaser_y = y - MM_14
     panel(c, center_x - 75 * mm, teaser_y, 150 * mm, teaser_h)
-    draw_left_accent_bar(c, center_x - 75 * mm, teaser_y, 5 * mm, teaser_h, accent)
+    draw_left_accent_bar(c, center_x - 75 * mm, teaser_y, MM_5, teaser_h, accent)
     c.setFillColor(COLOR_MUTED)
     c.setFont("Helvetica", 9)
-    c.drawString(center_x - 66 * mm, teaser_y - 7 * mm, "Preliminary result")
+    c.drawString(center_x - 66 * mm, teaser_y - MM_7, "Preliminary result")
     c.setFillColor(accent)
     c.setFont("Helvetica-Bold", 14)
     c.drawString(center_x - 66 * mm, teaser_y - 16 * mm, verdict_text)
 
     # Contact + TOC
-    y = teaser_y - teaser_h - 14 * mm
+    y = teaser_y - teaser_h - MM_14
     c.setFillColor(COLOR_MUTED)
     c.setFont("Helvetica", 9.5)
     c.drawCentredString(center_x, y, "clearheat.ie  ·  info@clearheat.ie")
 
-    y -= 14 * mm
+    y -= MM_14
     c.setFillColor(COLOR_PRIMARY)
     c.setFont("Helvetica-Bold", 11)
     c.drawCentredString(center_x, y, "Contents")
-    y -= 7 * mm
+    y -= MM_7
     toc = [
         ("2", "Executive Summary"),
         ("3–5", "Scenario Analysis (Best / Typical / Worst)"),
@@ -1282,9 +1542,13 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
     ]
     c.setFillColor(COLOR_TEXT)
     c.setFont("Helvetica", 10)
+    tobj = c.beginText()
     for pg, item in toc:
-        c.drawCentredString(center_x, y, f"Page {pg}  —  {item}")
-        y -= 6 * mm
+        line = f"Page {pg}  —  {item}"
+        tobj.setTextOrigin(center_x - c.stringWidth(line, "Helvetica", 10) / 2, y)
+        tobj.textOut(line)
+        y -= MM_6
+    c.drawText(tobj)
 
     c.showPage()
 
@@ -1292,12 +1556,12 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
     # Page 2 — Executive Summary
     # ===========================================================
     header_footer(c, 2, total_pages, W, H, margin, subtitle="Executive Summary")
-    y = H - margin - 12 * mm
+    y = CONTENT_TOP
 
     c.setFillColor(COLOR_TEXT)
     c.setFont("Helvetica-Bold", 16)
     c.drawString(x0, y, "Executive Summary")
-    y -= 8 * mm
+    y -= MM_8
 
     # --- Verdict panel ---
     y = draw_verdict_panel(
@@ -1310,11 +1574,11 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
 
     # --- Bottom line callout ---
     if affordable:
-        typ_12yr = (affordable.get("12yr") or {}).get("typical") or {}
+        typ_12yr = affordable_12yr.get("typical") or {}
         typ_12yr_net = safe_float(typ_12yr.get("affordable_net_eur")) or 0.0
         if quote_provided and personalised:
-            pb_typ = personalised.get("payback_years", {}).get("typical")
-            net_cost = safe_float(personalised.get("capex_eur"))
+            pb_typ = quote_payback.get("typical")
+            net_cost = quote_net_cost
             bottom_line = (
                 f"Your quoted cost ({eur(net_cost)} net after grant) would typically pay back "
                 f"in {years_text(pb_typ)} years. See your quote breakdown below."
@@ -1360,36 +1624,40 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
 
     # --- Your quote (personalised) — only if quote provided ---
     if quote_provided and personalised:
-        pb = personalised.get("payback_years", {})
-        net_cost = safe_float(personalised.get("capex_eur"))
+        pb = quote_payback
+        net_cost = quote_net_cost
         quote_gross = safe_float(personalised.get("hp_quote_eur"))
         grant_txt = f"€{int(grant_value_eur):,} SEAI grant applied" if grant_applied else "no grant applied"
 
-        y -= 2 * mm
+        y -= MM_2
         y = section_title(c, x0, y, "Your quote")
         panel_qh = 26 * mm
         panel(c, x0, y, usable_w, panel_qh)
-        qx = x0 + 5 * mm
-        qy = y - 7 * mm
-
-        c.setFillColor(COLOR_PRIMARY)
-        c.setFont("Helvetica-Bold", 10)
-        c.drawString(qx, qy, f"Quoted: {eur(quote_gross)}   →   Net after grant: {eur(net_cost)}   ({grant_txt})")
-        qy -= 7 * mm
-
-        c.setFillColor(COLOR_MUTED)
-        c.setFont("Helvetica", 9.5)
+        qx = x0 + MM_5
+        qy = y - MM_7
+
+        tobj = c.beginText(qx, qy)
+        tobj.setFillColor(COLOR_PRIMARY)
+        tobj.setFont("Helvetica-Bold", 10)
+        tobj.textOut(f"Quoted: {eur(quote_gross)}   →   Net after grant: {eur(net_cost)}   ({grant_txt})")
+        qy -= MM_7
+
+        tobj.setTextOrigin(qx, qy)
+        tobj.setFillColor(COLOR_MUTED)
+        tobj.setFont("Helvetica", 9.5)
         pb_best = years_text(pb.get("best"))
         pb_typ  = years_text(pb.get("typical"))
         pb_wst  = years_text(pb.get("worst"))
-        c.drawString(qx, qy, f"Simple payback  —  Best case: {pb_best} yr   ·   Typical: {pb_typ} yr   ·   Worst case: {pb_wst} yr")
-        qy -= 6 * mm
-        c.setFont("Helvetica-Oblique", 8.5)
-        c.drawString(qx, qy, "Payback estimated from your current fuel spend vs projected heat pump running costs.")
-        y -= panel_qh + 4 * mm
+        tobj.textOut(f"Simple payback  —  Best case: {pb_best} yr   ·   Typical: {pb_typ} yr   ·   Worst case: {pb_wst} yr")
+        qy -= MM_6
+        tobj.setTextOrigin(qx, qy)
+        tobj.setFont("Helvetica-Oblique", 8.5)
+        tobj.textOut("Payback estimated from your current fuel spend vs projected heat pump running costs.")
+        draw_text_object(c, tobj)
+        y -= panel_qh + MM_4
 
     # --- Key drivers (top 2 only on exec summary — keeps page from overflowing) ---
-    y -= 2 * mm
+    y -= MM_2
     y = section_title(c, x0, y, "What's driving this result?")
     drivers = dec.get("key_drivers", []) or []
     if drivers:
@@ -1406,11 +1674,11 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
         nonlocal y
         header_footer(c, page_num, total_pages, W, H, margin, subtitle=f"{scenario_name} Scenario")
 
-        y = H - margin - 12 * mm
+        y = CONTENT_TOP
         c.setFillColor(COLOR_TEXT)
         c.setFont("Helvetica-Bold", 16)
         c.drawString(x0, y, f"{scenario_name} Scenario")
-        y -= 10 * mm
+        y -= MM_10
 
         annual_savings = safe_float(scenario_block.get("savings_eur")) or 0.0
         years = 20
@@ -1438,7 +1706,7 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
             y = kv_row(c, x0, y, "Break-even year (base price)",
                        f"Year {be}" if be is not None else "Beyond 20 years", usable_w)
 
-            y -= 2 * mm
+            y -= MM_2
             y = section_title(c, x0, y, "How to read this graph")
             explain_lines = [
                 f"The horizontal line is your net cost after grant ({eur(ref_capex)}). When the savings line crosses it, the system has paid for itself.",
@@ -1457,7 +1725,7 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
             y -= 108 * mm
 
             # For stats, use the 12yr typical affordable as a reference
-            ref_for_stats = float((affordable.get("12yr") or {}).get(
+            ref_for_stats = float(affordable_12yr.get(
                 "best" if scenario_name.startswith("Best") else
                 "worst" if scenario_name.startswith("Worst") else "typical",
                 {}
@@ -1470,7 +1738,7 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
             y = kv_row(c, x0, y, "Implied break-even at typical Irish cost (after grant)",
                        f"~Year {typical_be}" if typical_be and typical_be <= 20 else "Beyond 20 years", usable_w)
 
-            y -= 2 * mm
+            y -= MM_2
             y = section_title(c, x0, y, "How to read this graph")
             explain_lines = [
                 f"The shaded band ({eur(net_low)}–{eur(net_high)} after grant) shows the typical cost range for an Irish heat pump installation.",
@@ -1490,28 +1758,28 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
     # Page 6 — Methodology and Disclaimers
     # ===========================================================
     header_footer(c, 6, total_pages, W, H, margin, subtitle="Methodology and Disclaimers")
-    y = H - margin - 12 * mm
+    y = CONTENT_TOP
 
     c.setFillColor(COLOR_TEXT)
     c.setFont("Helvetica-Bold", 16)
     c.drawString(x0, y, "Methodology and Disclaimers")
-    y -= 10 * mm
+    y -= MM_10
 
     y = section_title(c, x0, y, "How this report works")
-    y = draw_bullets(c, x0, y, methodology_text(), usable_w, size=10, leading=13)
+    y = _draw_prewrapped_bullets(c, x0, y, _METHODOLOGY_BULLETS, size=10, leading=13)
 
-    y -= 4 * mm
+    y -= MM_4
     y = section_title(c, x0, y, "Cross-check" + (" (bills vs BER)" if cross.get("consistency") != "unknown" else ""))
     consistency = title_case_keep_acronyms(str(cross.get("consistency", "unknown")).replace("_", " "))
     notes = cross.get("notes", []) or []
     y = draw_wrapped(c, x0, y, f"Status: {consistency}.", usable_w, size=10, leading=13)
     if notes:
-        y -= 2 * mm
+        y -= MM_2
         y = draw_bullets(c, x0, y, [str(n) for n in notes[:5]], usable_w, size=10, leading=13)
 
-    y -= 4 * mm
+    y -= MM_4
     y = section_title(c, x0, y, "Important disclaimers")
-    y = draw_bullets(c, x0, y, disclaimer_text(), usable_w, size=10, leading=13)
+    y = _draw_prewrapped_bullets(c, x0, y, _DISCLAIMER_BULLETS, size=10, leading=13)
 
     c.showPage()
 
@@ -1519,28 +1787,38 @@ def build_pdf(report: Dict[str, Any]) -> bytes:
     # Page 7 — Glossary
     # ===========================================================
     header_footer(c, 7, total_pages, W, H, margin, subtitle="Glossary")
-    y = H - margin - 12 * mm
+    y = CONTENT_TOP
 
     c.setFillColor(COLOR_TEXT)
     c.setFont("Helvetica-Bold", 16)
     c.drawString(x0, y, "Glossary")
-    y -= 8 * mm
+    y -= MM_8
     c.setFillColor(COLOR_MUTED)
     c.setFont("Helvetica", 10)
     c.drawString(x0, y, "Plain-English explanations of the terms used in this report.")
-    y -= 10 * mm
-
-    for term, definition in GLOSSARY:
-        c.setFillColor(COLOR_PRIMARY)
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(x0, y, title_case_keep_acronyms(term))
+    y -= MM_10
+
+    # Terms and definitions share one text object per page
+    tobj = c.beginText()
+    for term, definition_lines in _GLOSSARY_WRAPPED:
+        tobj.setTextOrigin(x0, y)
+        tobj.setFillColor(COLOR_PRIMARY)
+        tobj.setFont("Helvetica-Bold", 11)
+        tobj.textOut(term)
         y -= 5.5 * mm
-        y = draw_wrapped(c, x0, y, definition, usable_w, size=9.8, leading=12, color=COLOR_TEXT, sentence_case=True)
-        y -= 6 * mm
+        tobj.setTextOrigin(x0, y)
+        tobj.setFillColor(COLOR_TEXT)
+        tobj.setFont("Helvetica", 9.8, 12)
+        for line in definition_lines:
+            tobj.textLine(line)
+            y -= 12
+        y -= MM_6
         if y < margin + 25 * mm:
+            draw_text_object(c, tobj)
             c.showPage()
             header_footer(c, 7, total_pages, W, H, margin, subtitle="Glossary (Continued)")
-            y = H - margin - 12 * mm
+            y = CONTENT_TOP
+            tobj = c.beginText()
+    draw_text_object(c, tobj)
 
-    c.save()
-    return buf.getvalue()
\ No newline at end of file
+    return c.getpdfdata()
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+Regression checks pinning run_analysis output to the pre-optimisation engine.
+Expected figures were produced by the original (baseline) engine.py.
+"""
+from __future__ import annotations
+
+import pytest
+
+from engine import run_analysis
+
+
+BASE_INPUTS = {
+    "ber_band": "D",
+    "floor_area_m2": 120,
+    "emitters": "radiators",
+    "flow_temp_capability": "medium",
+    "heating_pattern": "normal",
+    "wood_use": "some",
+    "occupants": 3,
+    "fuel_type": "gas",
+    "fuel_price_eur_per_unit": 0.12,
+    "electricity_price_eur_per_kwh": 0.35,
+    "boiler_efficiency": 0.85,
+    "hp_quote_eur": 14000,
+}
+
+BILLS_INPUTS = {
+    **BASE_INPUTS,
+    "fuel_type": "kerosene",
+    "fuel_price_eur_per_unit": 1.05,
+    "bill_mode": "annual_spend",
+    "annual_spend_eur": 1800,
+    "dhw_on_same_fuel": False,
+}
+
+SCENARIO_KEYS = ("heat_kwh_th", "current_cost_eur", "hp_cost_eur", "savings_eur", "payback_years")
+
+
+def _scenario(heat, current, hp, savings, payback):
+    return dict(zip(SCENARIO_KEYS, (heat, current, hp, savings, payback)))
+
+
+def _assert_scenarios(actual, expected):
+    for name in ("best", "typical", "worst"):
+        assert set(actual[name]) == set(SCENARIO_KEYS), name
+        for key in SCENARIO_KEYS:
+            if expected[name][key] is None:
+                assert actual[name][key] is None, (name, key)
+            else:
+                assert actual[name][key] == pytest.approx(expected[name][key], rel=1e-12), (name, key)
+
+
+def _assert_exact(actual, expected):
+    # Same values *and* types (ints must stay ints in the JSON)
+    assert actual == expected
+    assert [type(v) for v in actual] == [type(v) for v in expected]
+
+
+def test_ber_only_matches_baseline():
+    report = run_analysis(BASE_INPUTS)
+
+    _assert_scenarios(report["results"]["ber_based"], {
+        "best": _scenario(11500.0, 1623.5294117647059, 1183.8235294117646, 439.7058823529412, 17.05685618729097),
+        "typical": _scenario(18100.0, 2555.294117647059, 2184.4827586206898, 370.81135902636925, 20.225917619386244),
+        "worst": _scenario(26200.0, 3698.8235294117644, 3820.8333333333335, -122.00980392156907, None),
+    })
+    assert report["results"]["bills_based"] == {
+        "available": False,
+        "anchor": {"mode": None, "annual_units": None, "annual_spend_eur": None},
+    }
+
+    assumptions = report["assumptions"]
+    _assert_exact(assumptions["dhw_kwh_th_per_year_band"], [2100, 2700, 3600])
+    _assert_exact(assumptions["scop_range"], [2.4, 2.9, 3.4])
+    _assert_exact(assumptions["ber_space_heat_intensity_kwh_th_per_m2_band"], [120, 170, 230])
+    assert assumptions["wood_offset_kwh_th_per_year"] == 5000.0
+
+    decision = report["decision"]
+    assert decision["primary_method"] == "ber_based"
+    assert decision["verdict"] == "borderline"
+    assert decision["confidence_score_0_100"] == 50
+    assert decision["market_verdict"] == "below_market"
+    assert decision["affordable_capex"]["12yr"]["typical"] == {"affordable_gross_eur": 4450, "affordable_net_eur": 0}
+    assert decision["npv_10yr_eur"] == pytest.approx(-3239.134092675928, rel=1e-12)
+
+
+def test_bills_matches_baseline():
+    report = run_analysis(BILLS_INPUTS)
+
+    # BER cross-check keeps its full cost breakdown by default
+    _assert_scenarios(report["results"]["ber_based"], {
+        "best": _scenario(11500.0, 1420.5882352941178, 1183.8235294117646, 236.76470588235316, 31.677018633540342),
+        "typical": _scenario(18100.0, 2235.8823529411766, 2184.4827586206898, 51.39959432048681, 145.91554853985795),
+        "worst": _scenario(26200.0, 3236.4705882352946, 3820.8333333333335, -584.3627450980389, None),
+    })
+
+    bills = report["results"]["bills_based"]
+    assert bills["available"] is True
+    assert bills["anchor"] == {"mode": "annual_spend", "annual_units": None, "annual_spend_eur": 1800.0}
+    _assert_scenarios(bills, {
+        "best": _scenario(14485.714285714283, 1620.0, 1491.1764705882347, 128.82352941176532, 58.219178082191505),
+        "typical": _scenario(17271.42857142857, 1800.0, 2084.4827586206893, -284.4827586206893, None),
+        "worst": _scenario(20357.14285714285, 1980.0000000000002, 2968.749999999999, -988.7499999999989, None),
+    })
+
+    assumptions = report["assumptions"]
+    _assert_exact(assumptions["dhw_kwh_th_per_year_band"], [2100, 2700, 3600])
+    _assert_exact(assumptions["ber_space_heat_intensity_kwh_th_per_m2_band"], [120, 170, 230])
+    assert assumptions["wood_offset_kwh_th_per_year"] == 0.0
+
+    decision = report["decision"]
+    assert decision["primary_method"] == "bills_based"
+    assert decision["verdict"] == "borderline"
+    assert decision["confidence_score_0_100"] == 65
+    assert decision["typical_payback_years"] is None
+    assert decision["affordable_capex"]["12yr"]["best"] == {"affordable_gross_eur": 1546, "affordable_net_eur": 0}
+    assert decision["npv_10yr_eur"] == pytest.approx(-9506.533869373046, rel=1e-12)
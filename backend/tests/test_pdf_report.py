@@ -0,0 +1,221 @@
+"""
+Regression checks for the PDF renderer's fast paths.
+_wrap_lines is compared against the original word-by-word wrapper, and
+StatefulCanvas output against a canvas that emits every state change.
+"""
+from __future__ import annotations
+
+import random
+import re
+import zlib
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen import canvas
+
+import pdf_report
+from engine import run_analysis
+from pdf_report import REPORT_FONTS, StatefulCanvas, _wrap_lines, build_pdf
+from test_engine import BASE_INPUTS, BILLS_INPUTS
+
+
+wrap_lines = _wrap_lines.__wrapped__  # bypass the lru_cache
+
+
+def _baseline_wrap_lines(text: str, font_name: str, font_size: float, max_width: float) -> List[str]:
+    """The original wrapper: grow a line word by word, splitting over-long words by glyph."""
+    text = (text or "").replace("\r\n", "\n").replace("\r", "\n")
+    out: List[str] = []
+    for para in text.split("\n"):
+        para = para.strip()
+        if not para:
+            out.append("")
+            continue
+        words = para.split()
+        line = ""
+        for w in words:
+            trial = w if not line else f"{line} {w}"
+            if pdfmetrics.stringWidth(trial, font_name, font_size) <= max_width:
+                line = trial
+            else:
+                if line:
+                    out.append(line)
+                if pdfmetrics.stringWidth(w, font_name, font_size) <= max_width:
+                    line = w
+                else:
+                    chunk = ""
+                    for ch in w:
+                        trial2 = chunk + ch
+                        if pdfmetrics.stringWidth(trial2, font_name, font_size) <= max_width:
+                            chunk = trial2
+                        else:
+                            if chunk:
+                                out.append(chunk)
+                            chunk = ch
+                    line = chunk
+        if line:
+            out.append(line)
+    return out
+
+
+def _check(text: str, font_name: str = "Helvetica", font_size: float = 10, max_width: float = 120.0) -> None:
+    expected = _baseline_wrap_lines(text, font_name, font_size, max_width)
+    assert list(wrap_lines(text, font_name, font_size, max_width)) == expected
+
+
+SENTENCE = "Heat pumps move heat rather than make it, so the seasonal efficiency matters most."
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    None,
+    "Short",
+    SENTENCE,
+    "  leading, trailing   and   repeated   spaces  ",
+    "tabs\tand no-break spaces",
+    "line one\r\nline two\rline three\nline four",
+    "\n\nblank paragraphs\n\n\nbetween\n",
+    "\r\n",
+    "Supercalifragilisticexpialidocious" * 3,
+    "short " + "x" * 200 + " tail",
+    "Savings of €1,250 — about €104/month • typical",
+    "• Bullet with a non-ASCII glyph: COP 3·5, 45 °C flow, “quoted” text",
+    "mixed ASCII then €€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€€ run",
+    "iiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiiii",
+    "WWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWW",
+])
+@pytest.mark.parametrize("font_name", REPORT_FONTS)
+@pytest.mark.parametrize("max_width", [0.0, -5.0, 3.0, 40.0, 120.0, 515.0])
+def test_wrap_matches_baseline(text, font_name, max_width):
+    _check(text, font_name, 10, max_width)
+
+
+@pytest.mark.parametrize("font_size", [0, 0.0, 7.5, 10, 13.25])
+@pytest.mark.parametrize("max_width", [0.0, -1.0, 60.0])
+def test_wrap_font_sizes(font_size, max_width):
+    _check(SENTENCE + " €5 — ok", "Helvetica", font_size, max_width)
+
+
+@pytest.mark.parametrize("font_name", REPORT_FONTS)
+def test_wrap_exact_fit_boundaries(font_name):
+    # Widths exactly at, just under and just over every word boundary of the sentence
+    for text in (SENTENCE, "Cost €1,250 — typical • range"):
+        words = text.split()
+        for n in range(1, len(words) + 1):
+            width = pdfmetrics.stringWidth(" ".join(words[:n]), font_name, 10)
+            for max_width in (width, width - 1e-9, width + 1e-9, width - 0.01, width + 0.01):
+                _check(text, font_name, 10, max_width)
+
+
+@pytest.mark.parametrize("font_name", REPORT_FONTS)
+def test_wrap_wide_glyph_runs(font_name):
+    # Runs of the widest glyphs sit right at the widest-glyph early return
+    for ch in "W@M—m":
+        for n in range(1, 40):
+            for text in (ch * n, " ".join([ch * 3] * n)):
+                width = pdfmetrics.stringWidth(text, font_name, 10)
+                for max_width in (width, width - 0.01, width * 0.95):
+                    _check(text, font_name, 10, max_width)
+
+
+def test_wrap_fuzz_matches_baseline():
+    rng = random.Random(20240601)
+    vocab = ["a", "I", "heat", "pump", "SCOP", "€1,250", "—", "•", "kWh/yr", "radiators", "W" * 12,
+             "il" * 15, "x" * 60, "Über", "naïve", "°C", "  ", "\n", "\r\n", "\t"]
+    for _ in range(1500):
+        text = " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 25)))
+        font_name = rng.choice(REPORT_FONTS)
+        font_size = rng.choice([6, 8, 9, 10, 11.5, 14])
+        max_width = rng.choice([0.0, 5.0, rng.uniform(10, 520)])
+        _check(text, font_name, font_size, max_width)
+
+
+# -----------------------------
+# StatefulCanvas
+# -----------------------------
+# StatefulCanvas skips fill/stroke/font changes by comparing against ReportLab
+# private state (_fillColorObj, _extgstate, _fontname, ...). If a ReportLab
+# release changes those internals, changes would be dropped silently, so the
+# fill, alpha and font in effect at every text-show operator are checked
+# against a canvas that emits every change.
+
+class _EmitEverythingCanvas(StatefulCanvas):
+    setFillColor = canvas.Canvas.setFillColor
+    setStrokeColor = canvas.Canvas.setStrokeColor
+    setFont = canvas.Canvas.setFont
+
+
+_OBJ_WITH_STREAM = re.compile(rb"(\d+) 0 obj\n<<((?:(?!endobj).)*?)>>\nstream\r?\n", re.S)
+_TOKEN = re.compile(rb"\((?:\\.|[^\\)])*\)|/[^\s/\[\]()<>]+|\[|\]|[^\s/\[\]()<>]+", re.S)
+_TEXT_SHOW = {b"Tj", b"TJ", b"'", b'"'}
+_FILL_OPS = {b"rg", b"g", b"k", b"sc", b"scn"}
+
+
+def _streams(pdf: bytes) -> Dict[int, bytes]:
+    out = {}
+    for m in _OBJ_WITH_STREAM.finditer(pdf):
+        length = int(re.search(rb"/Length (\d+)", m.group(2)).group(1))
+        data = pdf[m.end():m.end() + length]
+        out[int(m.group(1))] = zlib.decompress(data) if b"/FlateDecode" in m.group(2) else data
+    return out
+
+
+def _text_events(pdf: bytes) -> List[List[Tuple[Any, ...]]]:
+    """Per page: (fill, ExtGState, Tf operands, text) at each text-show operator, forms expanded."""
+    streams = _streams(pdf)
+    forms = {name: int(num) for name, num in re.findall(rb"/(FormXob\.\S+) (\d+) 0 R", pdf)}
+    kids = re.search(rb"/Kids \[ (.*?) \]", pdf).group(1)
+    pages = []
+    for page_num in re.findall(rb"(\d+) 0 R", kids):
+        contents = re.search(rb"\n" + page_num + rb" 0 obj\n<<\n/Contents (\d+) 0 R", pdf).group(1)
+        events: List[Tuple[Any, ...]] = []
+        _replay(streams[int(contents)], streams, forms, {"fill": None, "gs": None, "font": None}, events)
+        pages.append(events)
+    return pages
+
+
+def _replay(data: bytes, streams, forms, state: Dict[str, Any], events) -> None:
+    stack, operands = [], []
+    for tok in _TOKEN.findall(data):
+        if tok[:1] in b"(/[]" or re.fullmatch(rb"[-+.\d]+", tok):
+            operands.append(tok)
+            continue
+        if tok == b"q":
+            stack.append(dict(state))
+        elif tok == b"Q":
+            state = stack.pop()
+        elif tok in _FILL_OPS:
+            state["fill"] = (tok, tuple(operands))
+        elif tok == b"gs":
+            state["gs"] = operands[0]
+        elif tok == b"Tf":
+            state["font"] = tuple(operands)
+        elif tok == b"Do":
+            _replay(streams[forms[operands[0][1:]]], streams, forms, dict(state), events)
+        elif tok in _TEXT_SHOW:
+            events.append((state["fill"], state["gs"], state["font"], operands[-1]))
+        operands = []
+
+
+_PDF_REPORTS = {
+    "ber_only": BASE_INPUTS,
+    "ber_only_no_quote": {**BASE_INPUTS, "hp_quote_eur": None, "ber_band": "B", "emitters": "ufh"},
+    "bills": BILLS_INPUTS,
+    "bills_fuel_use": {**BILLS_INPUTS, "fuel_type": "gas", "fuel_price_eur_per_unit": 0.12,
+                       "bill_mode": "annual_fuel_use", "annual_fuel_use": 15000, "dhw_on_same_fuel": True},
+}
+
+
+@pytest.mark.parametrize("name", sorted(_PDF_REPORTS))
+def test_stateful_canvas_keeps_text_state(name, monkeypatch):
+    report = run_analysis(_PDF_REPORTS[name])
+    report["meta"]["generated_at_utc"] = "2026-01-01T00:00:00+00:00"
+
+    pages = _text_events(build_pdf(report))
+    monkeypatch.setattr(pdf_report, "StatefulCanvas", _EmitEverythingCanvas)
+    expected = _text_events(build_pdf(report))
+
+    assert sum(map(len, expected)) > 100
+    assert all(fill is not None and font is not None for page in pages for fill, _, font, _ in page)
+    assert pages == expected